@@ -10,8 +10,9 @@ This module is the SINGLE SOURCE OF TRUTH for every value that affects:
   - compute_semantic_hash()       → SEMANTIC_HASH_* constants
   - generate_block_id()           → BLOCK_ID_* constants
   - generate_table_id()           → TABLE_ID_* + BLOCK_ID_HEX_LENGTH
-  - generate_image_id()           → BLOCK_ID_* constants
+  - generate_image_id()           → BLOCK_ID_* + IMAGE_ID_* constants
   - hash_dict()                   → HASH_DICT_* constants
+  - hash_file(..., "sha256-tree") → SHA256_TREE_LEAF_SIZE
   - spatial ordering algorithm    → SPATIAL_* + BLOCK_TYPE_SORT_PRIORITY
   - canonical JSON serialization  → CANONICAL_JSON_* constants
 
@@ -61,10 +62,28 @@ TABLE_ID_TEXT_TRUNCATION: int = 200
 # The separator ":" must not appear in block_type values or IDs will collide.
 BLOCK_ID_COMPOSITE_TEMPLATE: str = "{block_type}:{page_number}:{order}:{content_sample}"
 
+# Construction used by generate_image_id().
+#   "composite" → hash image bytes, embed the truncated digest in
+#                 "{document_id}:img:{page_number}:{image_index}:{image_hash}",
+#                 hash that composite (default)
+#   "blake2b"   → single BLAKE2b pass over document_id + image bytes, with the
+#                 page/index position as salt and IMAGE_ID_BLAKE2B_PERSON as
+#                 personalization
+# The schemes emit different IDs for the same image; switching the default
+# changes every image ID ever issued.
+IMAGE_ID_SCHEME: str = "composite"
+IMAGE_ID_BLAKE2B_PERSON: bytes = b"layoutir-img"
+
 # String encoding used when hashing text.
 # UTF-8 is required; ASCII-only encoding would corrupt non-Latin content.
 HASH_STRING_ENCODING: str = "utf-8"
 
+# Leaf size for the opt-in "sha256-tree" file hash: the file is split into
+# leaves of this many bytes, each leaf is hashed, and the concatenated leaf
+# digests are hashed again. The digest depends on this value (never on the
+# thread count); changing it changes every "sha256-tree" digest.
+SHA256_TREE_LEAF_SIZE: int = 4 * 1024 * 1024
+
 # ---------------------------------------------------------------------------
 # SPATIAL ORDERING
 # STABILITY-CRITICAL: changing precision or key order changes spatial_order
@@ -124,6 +143,14 @@ HASH_DICT_SORT_KEYS: bool = True
 # are audited and a version bump is performed.
 HASH_DICT_ENSURE_ASCII: bool = True
 
+# Serializer that produces the hash_dict() input bytes.
+#   "json"   → json.dumps with the HASH_DICT_* kwargs above (ASCII-escaped, default)
+#   "orjson" → orjson.dumps with sorted keys (compact UTF-8, requires orjson)
+# The two emit different bytes for the same dict, so they are separate hash
+# families: a dict hashed under one never matches its hash under the other.
+# Changing the default changes hash_dict() output for every caller.
+HASH_DICT_SERIALIZER: str = "json"
+
 # NOTE: The two ensure_ascii values diverge by design.
 # canonical JSON (equality.py): ensure_ascii=False  → preserves UTF-8
 # hash_dict (hashing.py):       ensure_ascii=True   → ASCII-safe output
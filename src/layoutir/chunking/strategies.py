@@ -5,11 +5,11 @@ All chunking operates on the IR, not raw text.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List
 import logging
 
 from ..schema import Document, Block, Chunk, BlockType
-from ..utils.hashing import generate_chunk_id
+from ..utils.hashing import generate_chunk_id, generate_chunk_ids
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +46,48 @@ class ChunkStrategy(ABC):
             Chunk object
         """
         block_ids = [b.block_id for b in blocks]
-        content = "\n\n".join(b.content for b in blocks)
-
         chunk_id = generate_chunk_id(
             document_id=document.document_id, block_ids=block_ids, chunk_order=order
         )
+        return self._build_chunk(document, blocks, block_ids, order, chunk_id, metadata)
+
+    def _create_chunks(
+        self, document: Document, block_groups: List[List[Block]], **metadata
+    ) -> List[Chunk]:
+        """
+        Create one chunk per block group, ordered sequentially from 0.
+
+        Chunk IDs for the whole document are generated in one batched pass.
+
+        Args:
+            document: Parent document
+            block_groups: Blocks for each chunk, in chunk order
+            **metadata: Additional metadata shared by every chunk
+
+        Returns:
+            List of chunks
+        """
+        block_id_groups = [[b.block_id for b in blocks] for blocks in block_groups]
+        chunk_ids = generate_chunk_ids(document.document_id, enumerate(block_id_groups))
+
+        return [
+            self._build_chunk(document, blocks, block_ids, order, chunk_id, metadata)
+            for order, (blocks, block_ids, chunk_id) in enumerate(
+                zip(block_groups, block_id_groups, chunk_ids)
+            )
+        ]
+
+    def _build_chunk(
+        self,
+        document: Document,
+        blocks: List[Block],
+        block_ids: List[str],
+        order: int,
+        chunk_id: str,
+        metadata: Dict[str, Any],
+    ) -> Chunk:
+        """Assemble a Chunk from blocks and a precomputed chunk ID"""
+        content = "\n\n".join(b.content for b in blocks)
 
         # Compute page range
         page_numbers = [b.page_number for b in blocks]
@@ -101,9 +138,8 @@ class SemanticSectionChunker(ChunkStrategy):
         """
         logger.info(f"Chunking document by semantic sections (max level {self.max_heading_level})")
 
-        chunks = []
+        sections = []
         current_section = []
-        chunk_order = 0
 
         for block in document.blocks:
             # Check if this is a section boundary
@@ -114,15 +150,8 @@ class SemanticSectionChunker(ChunkStrategy):
             )
 
             if is_boundary and current_section:
-                # Create chunk from accumulated section
-                chunk = self._create_chunk(
-                    document=document,
-                    blocks=current_section,
-                    order=chunk_order,
-                    strategy="semantic_section",
-                )
-                chunks.append(chunk)
-                chunk_order += 1
+                # Close accumulated section
+                sections.append(current_section)
 
                 # Start new section
                 current_section = [block]
@@ -130,15 +159,11 @@ class SemanticSectionChunker(ChunkStrategy):
                 # Add to current section
                 current_section.append(block)
 
-        # Create chunk from final section
+        # Close final section
         if current_section:
-            chunk = self._create_chunk(
-                document=document,
-                blocks=current_section,
-                order=chunk_order,
-                strategy="semantic_section",
-            )
-            chunks.append(chunk)
+            sections.append(current_section)
+
+        chunks = self._create_chunks(document, sections, strategy="semantic_section")
 
         logger.info(f"Created {len(chunks)} semantic chunks")
         return chunks
@@ -181,8 +206,7 @@ class TokenWindowChunker(ChunkStrategy):
             f"(size={self.chunk_size}, overlap={self.overlap})"
         )
 
-        chunks = []
-        chunk_order = 0
+        windows = []
 
         # Concatenate all blocks
         all_blocks = document.blocks
@@ -196,17 +220,8 @@ class TokenWindowChunker(ChunkStrategy):
 
             # Check if adding this block exceeds window
             if current_chars + block_chars > self.chunk_chars and current_window:
-                # Create chunk from current window
-                chunk = self._create_chunk(
-                    document=document,
-                    blocks=current_window,
-                    order=chunk_order,
-                    strategy="token_window",
-                    token_size=self.chunk_size,
-                    overlap_tokens=self.overlap,
-                )
-                chunks.append(chunk)
-                chunk_order += 1
+                # Close current window
+                windows.append(current_window)
 
                 # Calculate overlap
                 overlap_chars_needed = self.overlap_chars
@@ -231,17 +246,17 @@ class TokenWindowChunker(ChunkStrategy):
             current_chars += block_chars
             i += 1
 
-        # Create chunk from final window
+        # Close final window
         if current_window:
-            chunk = self._create_chunk(
-                document=document,
-                blocks=current_window,
-                order=chunk_order,
-                strategy="token_window",
-                token_size=self.chunk_size,
-                overlap_tokens=self.overlap,
-            )
-            chunks.append(chunk)
+            windows.append(current_window)
+
+        chunks = self._create_chunks(
+            document,
+            windows,
+            strategy="token_window",
+            token_size=self.chunk_size,
+            overlap_tokens=self.overlap,
+        )
 
         logger.info(f"Created {len(chunks)} token window chunks")
         return chunks
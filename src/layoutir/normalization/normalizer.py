@@ -28,7 +28,7 @@ from ..utils.hashing import (
     generate_document_id,
     generate_block_id,
     generate_table_id,
-    generate_image_id,
+    generate_image_ids,
 )
 
 logger = logging.getLogger(__name__)
@@ -211,7 +211,7 @@ class Normalizer:
                 content=raw_table.raw_text,
                 page_number=raw_table.page_number,
                 order=raw_table.order,
-                block_type="table",
+                block_type=BlockType.TABLE,
             )
 
             # Normalize bounding box
@@ -238,14 +238,16 @@ class Normalizer:
         """Normalize images to canonical format"""
         blocks = []
 
-        for idx, raw_image in enumerate(raw_images):
-            # Generate deterministic image ID
-            image_id = generate_image_id(
-                document_id=self.document_id,
-                page_number=raw_image.page_number,
-                image_index=idx,
-                image_bytes=raw_image.image_bytes,
-            )
+        # Generate deterministic image IDs in one batched pass
+        image_ids = generate_image_ids(
+            self.document_id,
+            [
+                (raw_image.page_number, idx, raw_image.image_bytes)
+                for idx, raw_image in enumerate(raw_images)
+            ],
+        )
+
+        for raw_image, image_id in zip(raw_images, image_ids):
 
             # Create ImageData (path will be set during export)
             image_data = ImageData(
@@ -265,7 +267,7 @@ class Normalizer:
                 content=content,
                 page_number=raw_image.page_number,
                 order=raw_image.order,
-                block_type="image",
+                block_type=BlockType.IMAGE,
             )
 
             # Normalize bounding box
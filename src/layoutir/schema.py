@@ -12,7 +12,8 @@ Schema Version: 1.0.0 (backward-compatible additive extension)
 
 from __future__ import annotations
 from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from operator import attrgetter
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 from enum import Enum
 
@@ -214,6 +215,12 @@ class Document(BaseModel):
     processing_timestamp: datetime = Field(default_factory=datetime.utcnow)
     config_used: Dict[str, Any] = Field(default_factory=dict, description="Configuration snapshot")
 
+    @model_validator(mode="after")
+    def _blocks_in_order(self) -> Document:
+        """Invariant: blocks are sorted by order (stable; linear when already sorted)"""
+        self.blocks.sort(key=attrgetter("order"))
+        return self
+
 
 class Chunk(BaseModel):
     """Chunked segment of document for downstream processing"""
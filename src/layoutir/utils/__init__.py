@@ -8,9 +8,12 @@ from .hashing import (
     generate_document_id,
     generate_table_id,
     generate_image_id,
+    generate_image_ids,
     generate_chunk_id,
+    generate_chunk_ids,
+    id_hasher_for_document,
 )
-from .logging_config import setup_logging, LogContext
+from .logging_config import setup_logging, LogContext, LogContextFilter
 from .equality import (
     assert_semantic_equality,
     compute_semantic_hash,
@@ -25,9 +28,13 @@ __all__ = [
     "generate_document_id",
     "generate_table_id",
     "generate_image_id",
+    "generate_image_ids",
     "generate_chunk_id",
+    "generate_chunk_ids",
+    "id_hasher_for_document",
     "setup_logging",
     "LogContext",
+    "LogContextFilter",
     "assert_semantic_equality",
     "compute_semantic_hash",
     "SemanticEqualityChecker",
@@ -8,21 +8,90 @@ lengths, and ID prefix strings are frozen in _stability_constants.py.
 Do not change those values inline here; change them there with a schema bump.
 """
 
+import binascii
+import functools
 import hashlib
+import itertools
 import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Protocol, Sequence, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # optional: pip install layoutir[fast]
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional: pip install layoutir[fast]
+    _blake3 = None  # type: ignore[assignment,misc]
+
+from ..schema import BlockType
 from .._stability_constants import (
     BLOCK_ID_HASH_ALGORITHM,
     BLOCK_ID_HEX_LENGTH,
     BLOCK_ID_CONTENT_TRUNCATION,
     TABLE_ID_TEXT_TRUNCATION,
+    IMAGE_ID_SCHEME,
+    SHA256_TREE_LEAF_SIZE,
+    IMAGE_ID_BLAKE2B_PERSON,
     HASH_STRING_ENCODING,
     HASH_DICT_SORT_KEYS,
     HASH_DICT_ENSURE_ASCII,
+    HASH_DICT_SERIALIZER,
+)
+
+# Read size for hash_file()'s streaming loop. hashlib algorithms (including
+# the sha256 default) go through hashlib.file_digest with its own buffer, and
+# large blake3 files are memory-mapped, so this only affects blake3 files
+# under _PARALLEL_HASH_MIN_SIZE; output does not depend on it
+_BLOCK_SIZE = 1 << 20
+
+# Files at least this large are hashed with multiple threads where the
+# algorithm allows it; output does not depend on it, so tune freely
+_PARALLEL_HASH_MIN_SIZE = 4 * 1024 * 1024
+
+# json.dumps() builds a fresh JSONEncoder whenever kwargs are non-default;
+# build it once instead. kwargs frozen in _stability_constants.HASH_DICT_*
+_HASH_DICT_ENCODER = json.JSONEncoder(
+    sort_keys=HASH_DICT_SORT_KEYS, ensure_ascii=HASH_DICT_ENSURE_ASCII
 )
 
+# Raw digest bytes behind a BLOCK_ID_HEX_LENGTH-character hex prefix
+_ID_DIGEST_BYTES = BLOCK_ID_HEX_LENGTH // 2
+
+# Hash constructor resolved once — algorithm frozen in BLOCK_ID_HASH_ALGORITHM
+_HASH_CTOR: Callable[..., "hashlib._Hash"] = getattr(hashlib, BLOCK_ID_HASH_ALGORITHM)
+
+# Pre-encoded block type values; BlockType is a str enum, so the raw string
+# "table" and BlockType.TABLE hit the same entry
+_TYPE_BYTES: Dict[str, bytes] = {bt: bt.value.encode(HASH_STRING_ENCODING) for bt in BlockType}
+
+
+class _Hasher(Protocol):
+    """Streaming interface shared by hashlib objects and blake3"""
+
+    def update(self, data: Union[bytes, memoryview], /) -> object: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def _new_hasher(algorithm: str) -> _Hasher:
+    """
+    Create a hasher by name, adding "blake3" to the hashlib algorithms.
+
+    BLAKE3 is opt-in only: every ID and hash default stays on the frozen
+    BLOCK_ID_HASH_ALGORITHM, and the two families never produce equal digests.
+    """
+    if algorithm == "blake3":
+        if _blake3 is None:
+            raise RuntimeError("blake3 not available. Install with: pip install layoutir[fast]")
+        return _blake3()
+    return hashlib.new(algorithm)
+
 
 def hash_file(file_path: Union[str, Path], algorithm: str = BLOCK_ID_HASH_ALGORITHM) -> str:
     """
@@ -30,39 +99,105 @@ def hash_file(file_path: Union[str, Path], algorithm: str = BLOCK_ID_HASH_ALGORI
 
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm (default: sha256)
+        algorithm: Hash algorithm (default: sha256; "blake3" needs the fast extra).
+            "sha256-tree" selects a parallel tree hash whose digest differs
+            from plain sha256.
 
     Returns:
         Hexadecimal hash digest
     """
     file_path = Path(file_path)
-    hasher = hashlib.new(algorithm)
 
-    with open(file_path, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+    if algorithm == "sha256-tree":
+        return _hash_file_sha256_tree(file_path)
+
+    if algorithm == "blake3" and file_path.stat().st_size >= _PARALLEL_HASH_MIN_SIZE:
+        if _blake3 is None:
+            raise RuntimeError("blake3 not available. Install with: pip install layoutir[fast]")
+        # BLAKE3 is a tree hash internally: the same digest, hashed across cores
+        mmap_hasher = _blake3(max_threads=_blake3.AUTO)
+        mmap_hasher.update_mmap(file_path)
+        return mmap_hasher.hexdigest()
+
+    if algorithm in hashlib.algorithms_available:
+        # Stdlib digest loop; it also takes zero-copy paths for in-memory files
+        with open(file_path, "rb", buffering=0) as f:
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+    hasher = _new_hasher(algorithm)
+
+    # Read in large chunks into one reused buffer: fewer Python-level
+    # read/update calls, so the C hash backend does the bulk of the work
+    buffer = memoryview(bytearray(_BLOCK_SIZE))
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            hasher.update(buffer[:n])
 
     return hasher.hexdigest()
 
 
+def _hash_file_sha256_tree(file_path: Path) -> str:
+    """
+    Hash a file as a one-level SHA-256 tree, hashing leaves in parallel.
+
+    The digest is SHA-256 over the concatenated SHA-256 digests of each
+    SHA256_TREE_LEAF_SIZE slice of the file. It differs from the plain
+    SHA-256 of the file and does not depend on the number of threads.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return hashlib.sha256().hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                leaves = [
+                    view[start : start + SHA256_TREE_LEAF_SIZE]
+                    for start in range(0, size, SHA256_TREE_LEAF_SIZE)
+                ]
+                # hashlib releases the GIL on large buffers, so leaves hash concurrently
+                workers = min(len(leaves), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    digests = list(pool.map(lambda leaf: hashlib.sha256(leaf).digest(), leaves))
+                for leaf in leaves:
+                    leaf.release()
+
+    return hashlib.sha256(b"".join(digests)).hexdigest()
+
+
 def hash_string(text: str, algorithm: str = BLOCK_ID_HASH_ALGORITHM) -> str:
     """
     Compute deterministic hash of a string.
 
     Args:
         text: Input string
-        algorithm: Hash algorithm (default: sha256)
+        algorithm: Hash algorithm (default: sha256; "blake3" needs the fast extra)
 
     Returns:
         Hexadecimal hash digest
     """
-    hasher = hashlib.new(algorithm)
-    hasher.update(text.encode(HASH_STRING_ENCODING))
+    return _hash_bytes(text.encode(HASH_STRING_ENCODING), algorithm)
+
+
+def _hash_bytes(data: bytes, algorithm: str = BLOCK_ID_HASH_ALGORITHM) -> str:
+    """Hash already-encoded bytes, skipping the str round-trip."""
+    hasher = _new_hasher(algorithm)
+    hasher.update(data)
     return hasher.hexdigest()
 
 
-def hash_dict(data: Dict[str, Any], algorithm: str = BLOCK_ID_HASH_ALGORITHM) -> str:
+def _hash_dict_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize a dict to sorted-key JSON bytes via orjson."""
+    if orjson is None:
+        raise RuntimeError("orjson not available. Install with: pip install layoutir[fast]")
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+def hash_dict(
+    data: Dict[str, Any],
+    algorithm: str = BLOCK_ID_HASH_ALGORITHM,
+    serializer: str = HASH_DICT_SERIALIZER,
+) -> str:
     """
     Compute deterministic hash of a dictionary.
 
@@ -70,20 +205,28 @@ def hash_dict(data: Dict[str, Any], algorithm: str = BLOCK_ID_HASH_ALGORITHM) ->
 
     Args:
         data: Input dictionary
-        algorithm: Hash algorithm (default: sha256)
+        algorithm: Hash algorithm (default: sha256; "blake3" needs the fast extra)
+        serializer: "json" (default) or "orjson". The two serialize to
+            different bytes and therefore form separate hash families.
 
     Returns:
         Hexadecimal hash digest
     """
-    # kwargs frozen in _stability_constants.HASH_DICT_*
-    # ensure_ascii intentionally differs from canonical JSON — do not unify
-    normalized = json.dumps(
-        data, sort_keys=HASH_DICT_SORT_KEYS, ensure_ascii=HASH_DICT_ENSURE_ASCII
-    )
-    return hash_string(normalized, algorithm)
+    if serializer == "orjson":
+        # orjson emits UTF-8 bytes directly — no intermediate str to encode
+        return _hash_bytes(_hash_dict_bytes(data), algorithm)
+    if serializer != "json":
+        raise ValueError(f"Unknown hash_dict serializer: {serializer}")
+
+    # Same bytes as json.dumps() with the HASH_DICT_* kwargs; ensure_ascii
+    # intentionally differs from canonical JSON — do not unify
+    normalized = _HASH_DICT_ENCODER.encode(data)
+    return _hash_bytes(normalized.encode(HASH_STRING_ENCODING), algorithm)
 
 
-def generate_block_id(content: str, page_number: int, order: int, block_type: str) -> str:
+def generate_block_id(
+    content: str, page_number: int, order: int, block_type: Union[BlockType, str]
+) -> str:
     """
     Generate deterministic block ID.
 
@@ -93,7 +236,7 @@ def generate_block_id(content: str, page_number: int, order: int, block_type: st
         content: Block text content
         page_number: Page number
         order: Sequential order in document
-        block_type: Block type string
+        block_type: BlockType member or raw block type string (hashed by value)
 
     Returns:
         Block ID (first 16 chars of hash for readability)
@@ -101,13 +244,29 @@ def generate_block_id(content: str, page_number: int, order: int, block_type: st
     # Truncate content — length frozen in _stability_constants.BLOCK_ID_CONTENT_TRUNCATION
     content_sample = content[:BLOCK_ID_CONTENT_TRUNCATION]
 
-    composite = f"{block_type}:{page_number}:{order}:{content_sample}"
-    full_hash = hash_string(composite)
+    # BlockType members and their raw value strings share one entry
+    type_bytes = _TYPE_BYTES.get(block_type)
+    if type_bytes is None:
+        # Unknown raw type strings still hash under their own name
+        type_bytes = block_type.encode(HASH_STRING_ENCODING)
+
+    # Same bytes as BLOCK_ID_COMPOSITE_TEMPLATE encoded: the shared
+    # "{block_type}:{page_number}:" prefix state is hash-consed, so only the
+    # per-block "{order}:{content_sample}" suffix is formatted and absorbed
+    hasher = _block_prefix_state(type_bytes, page_number).copy()
+    hasher.update(b"%d:%s" % (order, content_sample.encode(HASH_STRING_ENCODING)))
+    full_hash = hasher.hexdigest()
 
     # ID length frozen in _stability_constants.BLOCK_ID_HEX_LENGTH
     return f"blk_{full_hash[:BLOCK_ID_HEX_LENGTH]}"
 
 
+@functools.lru_cache(maxsize=4096)
+def _block_prefix_state(type_bytes: bytes, page_number: int) -> "hashlib._Hash":
+    """Hasher that has absorbed "{block_type}:{page_number}:"; callers .copy() it."""
+    return _HASH_CTOR(b"%s:%d:" % (type_bytes, page_number))
+
+
 def generate_document_id(file_hash: str) -> str:
     """
     Generate deterministic document ID from file hash.
@@ -136,15 +295,25 @@ def generate_table_id(document_id: str, page_number: int, table_index: int, raw_
         Table ID
     """
     # Text truncation length frozen in _stability_constants.TABLE_ID_TEXT_TRUNCATION
-    composite = (
-        f"{document_id}:table:{page_number}:{table_index}:{raw_text[:TABLE_ID_TEXT_TRUNCATION]}"
+    text_sample = raw_text[:TABLE_ID_TEXT_TRUNCATION]
+
+    # Remainder of "{document_id}:table:{page_number}:{table_index}:{text_sample}",
+    # formatted straight to bytes instead of an f-string that is then encoded
+    hasher = id_hasher_for_document(document_id)
+    hasher.update(
+        b"table:%d:%d:%s" % (page_number, table_index, text_sample.encode(HASH_STRING_ENCODING))
     )
-    full_hash = hash_string(composite)
+    full_hash = hasher.hexdigest()
+
     return f"tbl_{full_hash[:BLOCK_ID_HEX_LENGTH]}"
 
 
 def generate_image_id(
-    document_id: str, page_number: int, image_index: int, image_bytes: bytes
+    document_id: str,
+    page_number: int,
+    image_index: int,
+    image_bytes: bytes,
+    scheme: str = IMAGE_ID_SCHEME,
 ) -> str:
     """
     Generate deterministic image ID.
@@ -154,39 +323,162 @@ def generate_image_id(
         page_number: Page number
         image_index: Index of image on page
         image_bytes: Image binary data
+        scheme: "composite" (default) or "blake2b". The two schemes emit
+            different IDs for the same image.
 
     Returns:
         Image ID
     """
+    if scheme == "blake2b":
+        return _blake2b_image_id(document_id, page_number, image_index, image_bytes)
+    if scheme != "composite":
+        raise ValueError(f"Unknown image ID scheme: {scheme}")
+
+    hasher = id_hasher_for_document(document_id)
+    hasher.update(b"img:")
+    return _finish_image_id(hasher, page_number, image_index, image_bytes)
+
+
+def generate_image_ids(
+    document_id: str,
+    items: Iterable[Tuple[int, int, bytes]],
+    scheme: str = IMAGE_ID_SCHEME,
+) -> List[str]:
+    """
+    Generate deterministic image IDs for many images of one document.
+
+    Returns the same IDs as calling generate_image_id() per image.
+
+    Args:
+        document_id: Parent document ID
+        items: (page_number, image_index, image_bytes) triples
+        scheme: "composite" (default) or "blake2b"
+
+    Returns:
+        Image IDs, in input order
+    """
+    if scheme == "blake2b":
+        return [_blake2b_image_id(document_id, *item) for item in items]
+    if scheme != "composite":
+        raise ValueError(f"Unknown image ID scheme: {scheme}")
+
+    base = id_hasher_for_document(document_id)
+    base.update(b"img:")
+    return [_finish_image_id(base.copy(), *item) for item in items]
+
+
+def _finish_image_id(
+    hasher: "hashlib._Hash", page_number: int, image_index: int, image_bytes: bytes
+) -> str:
+    """Absorb the per-image composite suffix into a prefix-seeded hasher."""
     # Hash the image content — algorithm frozen in _stability_constants.BLOCK_ID_HASH_ALGORITHM
-    hasher = hashlib.new(BLOCK_ID_HASH_ALGORITHM)
-    hasher.update(image_bytes)
-    image_hash = hasher.hexdigest()[:BLOCK_ID_HEX_LENGTH]
+    # Hex-encoding the leading digest bytes yields the same ASCII as the
+    # truncated hexdigest(), already as bytes (BLOCK_ID_HEX_LENGTH is even)
+    image_hash = binascii.hexlify(_HASH_CTOR(image_bytes).digest()[:_ID_DIGEST_BYTES])
 
-    # Combine with position
-    composite = f"{document_id}:img:{page_number}:{image_index}:{image_hash}"
-    full_hash = hash_string(composite)
+    # Remainder of "{document_id}:img:{page_number}:{image_index}:{image_hash}"
+    hasher.update(b"%d:%d:%s" % (page_number, image_index, image_hash))
+    full_hash = hasher.hexdigest()
 
     return f"img_{full_hash[:BLOCK_ID_HEX_LENGTH]}"
 
 
-def generate_chunk_id(document_id: str, block_ids: List[str], chunk_order: int) -> str:
+def _blake2b_image_id(
+    document_id: str, page_number: int, image_index: int, image_bytes: bytes
+) -> str:
+    """Single-pass BLAKE2b image ID: position as salt, image bytes hashed once."""
+    salt = b"%d:%d" % (page_number, image_index)
+    if len(salt) > hashlib.blake2b.SALT_SIZE:
+        raise ValueError(f"Image position {page_number}:{image_index} exceeds BLAKE2b salt size")
+
+    hasher = hashlib.blake2b(
+        digest_size=_ID_DIGEST_BYTES, person=IMAGE_ID_BLAKE2B_PERSON, salt=salt
+    )
+    hasher.update(document_id.encode(HASH_STRING_ENCODING))
+    hasher.update(b":")
+    hasher.update(image_bytes)
+    return f"img_{hasher.hexdigest()}"
+
+
+def id_hasher_for_document(document_id: str) -> "hashlib._Hash":
+    """
+    Create a hasher pre-seeded with the "{document_id}:" composite prefix.
+
+    Batch ID generation ``.copy()``s this hasher per ID so the shared prefix
+    is absorbed once per document instead of once per ID.
+
+    Args:
+        document_id: Parent document ID
+
+    Returns:
+        Hasher object (algorithm frozen in BLOCK_ID_HASH_ALGORITHM)
+    """
+    hasher = _HASH_CTOR()
+    hasher.update(document_id.encode(HASH_STRING_ENCODING))
+    hasher.update(b":")
+    return hasher
+
+
+def generate_chunk_id(
+    document_id: str, block_ids: Sequence[str], chunk_order: int, presorted: bool = False
+) -> str:
     """
     Generate deterministic chunk ID.
 
     Args:
         document_id: Parent document ID
-        block_ids: List of block IDs in chunk
+        block_ids: Block IDs in chunk (any order unless presorted)
         chunk_order: Sequential order of chunk
+        presorted: Caller guarantees block_ids is already sorted, so the
+            sort is skipped (checked only when assertions are enabled)
 
     Returns:
         Chunk ID
     """
-    # Sort block IDs for determinism
-    sorted_blocks = sorted(block_ids)
-    blocks_str = ",".join(sorted_blocks)
+    hasher = id_hasher_for_document(document_id)
+    hasher.update(b"chunk:")
+    return _finish_chunk_id(hasher, block_ids, chunk_order, presorted)
+
+
+def generate_chunk_ids(
+    document_id: str, items: Iterable[Tuple[int, Sequence[str]]], presorted: bool = False
+) -> List[str]:
+    """
+    Generate deterministic chunk IDs for many chunks of one document.
+
+    Returns the same IDs as calling generate_chunk_id() per chunk.
+
+    Args:
+        document_id: Parent document ID
+        items: (chunk_order, block_ids) pairs
+        presorted: Every block_ids sequence is already sorted
 
-    composite = f"{document_id}:chunk:{chunk_order}:{blocks_str}"
-    full_hash = hash_string(composite)
+    Returns:
+        Chunk IDs, in input order
+    """
+    base = id_hasher_for_document(document_id)
+    base.update(b"chunk:")
+    return [
+        _finish_chunk_id(base.copy(), block_ids, chunk_order, presorted)
+        for chunk_order, block_ids in items
+    ]
+
+
+def _finish_chunk_id(
+    hasher: "hashlib._Hash", block_ids: Sequence[str], chunk_order: int, presorted: bool = False
+) -> str:
+    """Absorb the per-chunk composite suffix into a prefix-seeded hasher."""
+    # Block IDs are hashed sorted for determinism
+    if not presorted:
+        block_ids = sorted(block_ids)
+    elif __debug__:
+        assert all(a <= b for a, b in itertools.pairwise(block_ids)), "block_ids not sorted"
+
+    # Remainder of "{document_id}:chunk:{chunk_order}:{blocks_str}". One
+    # join/encode/update keeps the per-ID work in C; block ID strings are
+    # small, so the copy is cheap
+    blocks_str = ",".join(block_ids)
+    hasher.update(b"%d:%s" % (chunk_order, blocks_str.encode(HASH_STRING_ENCODING)))
+    full_hash = hasher.hexdigest()
 
     return f"chk_{full_hash[:BLOCK_ID_HEX_LENGTH]}"
@@ -4,12 +4,55 @@ Structured logging configuration for observability.
 Provides JSON-formatted logs with timing and context.
 """
 
+import atexit
+import contextvars
+import copy
 import logging
+import queue
 import sys
 import json
-from datetime import datetime
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: pip install layoutir[fast]
+    orjson = None  # type: ignore[assignment]
+
+_LEVEL_NAMES = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+
+def _dumps(log_data: Dict[str, Any]) -> str:
+    """Serialize a log record dict, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_data).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) take the json path
+            pass
+    return json.dumps(log_data)
+
+
+@lru_cache(maxsize=1)
+def _utc_second(seconds: int) -> str:
+    """ISO-8601 UTC prefix for a whole second, cached across records in that second"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _utc_timestamp(created: float) -> str:
+    """Millisecond-precision ISO-8601 UTC timestamp, e.g. 2024-01-31T12:00:00.123Z"""
+    millis = int(created * 1000)
+    seconds, millis = divmod(millis, 1000)
+    return f"{_utc_second(seconds)}.{millis:03d}Z"
 
 
 class StructuredFormatter(logging.Formatter):
@@ -18,10 +61,11 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": record.levelname,
+            "timestamp": _utc_timestamp(record.created),
+            "level": _LEVEL_NAMES.get(record.levelno) or record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            # Only interpolate when there are args; getMessage() also str()s msg
+            "message": record.getMessage() if record.args else str(record.msg),
         }
 
         # Add extra fields if present
@@ -38,7 +82,123 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Enqueue records for the listener thread without formatting them"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message but keep exc_info for the real formatter"""
+        # The queue is in-process, so nothing needs to be picklable; only the
+        # args are resolved here, since they may be mutated after logging
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+# Fields set by active LogContext blocks; each block installs a new dict,
+# so the shared default is never mutated
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    "layoutir_log_context", default={}
+)
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Copy the active LogContext fields onto records.
+
+    setup_logging() attaches it to its handlers; add it to your own
+    handlers when configuring logging yourself.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Attach context fields; explicit ``extra=`` values take precedence"""
+        for key, value in _log_context.get().items():
+            if key not in record.__dict__:
+                setattr(record, key, value)
+        return True
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes through a large buffer and flushes in batches.
+
+    The stream is flushed on every WARNING-or-higher record and otherwise
+    once per ``flush_every`` records, instead of after every record. At
+    most ``flush_every - 1`` lower-level records are lost on a hard crash.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        flush_every: int = 100,
+        buffer_size: int = 1 << 16,
+        encoding: Optional[str] = None,
+    ):
+        """
+        Initialize buffered file handler.
+
+        Args:
+            filename: Log file path (opened for append)
+            flush_every: Flush after this many records
+            buffer_size: Write buffer size in bytes
+            encoding: Text encoding (platform default if None)
+        """
+        self.flush_every = flush_every
+        self.buffer_size = buffer_size
+        self._pending = 0
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the formatted record, flushing only when due"""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if record.levelno >= logging.WARNING or self._pending >= self.flush_every:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the stream and reset the pending-record count"""
+        super().flush()
+        self._pending = 0
+
+
+# Background thread that formats and writes records for setup_logging()
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Drain and stop the current queue listener, closing its handlers"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+# Registered after logging's own shutdown hook, so it runs first and the
+# queue is drained before handlers are flushed
+atexit.register(_stop_listener)
 
 
 def setup_logging(
@@ -47,11 +207,17 @@ def setup_logging(
     """
     Setup logging configuration.
 
+    Console records are written synchronously, so they stay ordered with
+    anything else printed to stdout. File records are formatted and written
+    on a background listener thread; the logging call only enqueues them.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file path for logs
         structured: Use structured JSON format
     """
+    global _listener
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
@@ -59,8 +225,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove existing handlers
+    # Remove existing handlers, draining any previous listener first
     root_logger.handlers = []
+    _stop_listener()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -73,17 +240,28 @@ def setup_logging(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
 
+    # Context is read on the producer side, before any thread hand-off
+    context_filter = LogContextFilter()
+    console_handler.addFilter(context_filter)
     root_logger.addHandler(console_handler)
 
     # File handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file)
+        # orjson emits raw UTF-8, so the file must not use the locale encoding
+        file_handler = _BufferedFileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(StructuredFormatter())
 
-        root_logger.addHandler(file_handler)
+        # File formatting and I/O happen on the listener thread
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+
+        queue_handler = _RecordQueueHandler(log_queue)
+        queue_handler.addFilter(context_filter)
+        root_logger.addHandler(queue_handler)
 
     # Set log level for specific libraries
     logging.getLogger("PIL").setLevel(logging.WARNING)
@@ -91,7 +269,14 @@ def setup_logging(
 
 
 class LogContext:
-    """Context manager for adding context to logs"""
+    """
+    Context manager for adding context to logs.
+
+    Fields are held in a ContextVar, so concurrent threads and tasks each
+    see only their own (nested) contexts. They are attached to records by
+    LogContextFilter, which setup_logging() installs on its handlers;
+    ``extra=`` values passed to a logging call take precedence.
+    """
 
     def __init__(self, logger: logging.Logger, **context):
         """
@@ -103,20 +288,14 @@ class LogContext:
         """
         self.logger = logger
         self.context = context
-        self.old_factory = logging.getLogRecordFactory()
+        self._token: Optional[contextvars.Token] = None
 
     def __enter__(self):
         """Enter context"""
-
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-
-        logging.setLogRecordFactory(record_factory)
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context"""
-        logging.setLogRecordFactory(self.old_factory)
+        _log_context.reset(self._token)
+        self._token = None
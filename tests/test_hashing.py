@@ -0,0 +1,141 @@
+"""Hashing and ID generation tests"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from layoutir import Document
+from layoutir.utils.equality import compute_semantic_hash
+from layoutir.utils.hashing import (
+    _PARALLEL_HASH_MIN_SIZE,
+    generate_chunk_id,
+    generate_chunk_ids,
+    generate_image_id,
+    generate_image_ids,
+    hash_dict,
+    hash_file,
+    hash_string,
+)
+from layoutir._stability_constants import (
+    HASH_DICT_ENSURE_ASCII,
+    HASH_DICT_SORT_KEYS,
+    SHA256_TREE_LEAF_SIZE,
+)
+
+try:
+    import orjson
+except ImportError:  # optional: pip install layoutir[fast]
+    orjson = None
+
+try:
+    from blake3 import blake3
+except ImportError:  # optional: pip install layoutir[fast]
+    blake3 = None
+
+
+class TestSemanticHashFreshness:
+    """compute_semantic_hash() always reflects the document's current content"""
+
+    def test_nested_edit_changes_hash(self):
+        """Test: in-place block edits are visible to the next hash"""
+        ir_path = Path(__file__).parent / "fixtures" / "golden_ir" / "table_ir.json"
+        doc = Document.model_validate_json(ir_path.read_bytes())
+
+        first = compute_semantic_hash(doc)
+        assert compute_semantic_hash(doc) == first
+
+        edited = doc.model_copy(deep=True)
+        assert compute_semantic_hash(edited) == first
+        edited.blocks[0].content = "changed"
+        assert compute_semantic_hash(edited) != first
+        assert compute_semantic_hash(doc) == first
+
+
+class TestBatchIdGeneration:
+    """Batched ID helpers must emit exactly the per-call IDs"""
+
+    def test_chunk_ids_match_single_calls(self):
+        """Test: generate_chunk_ids == generate_chunk_id per chunk"""
+        items = [(0, ["blk_b", "blk_a", "blk_c"]), (1, []), (2, ["blk_z"])]
+        expected = [generate_chunk_id("doc_test", block_ids, order) for order, block_ids in items]
+        assert generate_chunk_ids("doc_test", items) == expected
+
+    def test_presorted_chunk_ids_match(self):
+        """Test: presorted=True only skips the sort, it does not change the ID"""
+        block_ids = ("blk_a", "blk_b", "blk_c")
+        assert generate_chunk_id("doc_test", block_ids, 4, presorted=True) == generate_chunk_id(
+            "doc_test", ["blk_c", "blk_a", "blk_b"], 4
+        )
+
+    @pytest.mark.parametrize("scheme", ["composite", "blake2b"])
+    def test_image_ids_match_single_calls(self, scheme):
+        """Test: generate_image_ids == generate_image_id per image"""
+        items = [(1, 0, b"\x89PNG-a"), (1, 1, b"\x89PNG-b"), (3, 2, b"")]
+        expected = [generate_image_id("doc_test", *item, scheme=scheme) for item in items]
+        assert generate_image_ids("doc_test", items, scheme=scheme) == expected
+
+
+class TestHashDict:
+    """Opt-in hash_dict serializers are fixed constructions"""
+
+    DATA = {"zeta": [1, 2.5, None], "alpha": {"b": True, "a": "café"}, "n": 7}
+
+    @pytest.mark.skipif(orjson is None, reason="orjson not installed")
+    def test_orjson_serializer_matches_reference(self):
+        """Test: orjson family == SHA-256 over sorted-key orjson bytes"""
+        serialized = orjson.dumps(self.DATA, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        expected = hashlib.sha256(serialized).hexdigest()
+        assert hash_dict(self.DATA, serializer="orjson") == expected
+        # A separate hash family from the default json serializer
+        assert hash_dict(self.DATA) != expected
+
+    def test_unknown_serializer_raises(self):
+        """Test: an unknown serializer is rejected, not silently defaulted"""
+        with pytest.raises(ValueError, match="serializer"):
+            hash_dict(self.DATA, serializer="msgpack")
+
+
+@pytest.mark.skipif(blake3 is None, reason="blake3 not installed")
+class TestBlake3:
+    """algorithm="blake3" is plain BLAKE3 over the same bytes SHA-256 would see"""
+
+    def test_hash_string_matches_reference(self):
+        """Test: hash_string(..., "blake3") == BLAKE3 of the UTF-8 text"""
+        text = "Ünïcode table 表"
+        assert hash_string(text, "blake3") == blake3(text.encode("utf-8")).hexdigest()
+
+    def test_hash_dict_matches_reference(self):
+        """Test: hash_dict(..., "blake3") == BLAKE3 of the default json serialization"""
+        data = TestHashDict.DATA
+        serialized = json.dumps(
+            data, sort_keys=HASH_DICT_SORT_KEYS, ensure_ascii=HASH_DICT_ENSURE_ASCII
+        )
+        assert hash_dict(data, "blake3") == blake3(serialized.encode()).hexdigest()
+
+
+class TestHashFile:
+    """Opt-in parallel file hashes are fixed constructions"""
+
+    def test_sha256_tree_matches_reference(self, tmp_path):
+        """Test: sha256-tree == SHA-256 over the per-leaf SHA-256 digests"""
+        data = bytes(range(256)) * (SHA256_TREE_LEAF_SIZE // 128 + 3)
+        path = tmp_path / "two_and_a_bit_leaves.bin"
+        path.write_bytes(data)
+
+        leaf_digests = b"".join(
+            hashlib.sha256(data[i : i + SHA256_TREE_LEAF_SIZE]).digest()
+            for i in range(0, len(data), SHA256_TREE_LEAF_SIZE)
+        )
+        assert hash_file(path, "sha256-tree") == hashlib.sha256(leaf_digests).hexdigest()
+
+    @pytest.mark.skipif(blake3 is None, reason="blake3 not installed")
+    @pytest.mark.parametrize("size", [1000, _PARALLEL_HASH_MIN_SIZE + 12345])
+    def test_blake3_matches_reference(self, tmp_path, size):
+        """Test: the streamed and the mmap multi-threaded BLAKE3 paths give plain BLAKE3"""
+        data = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        path = tmp_path / f"blake3_{size}.bin"
+        path.write_bytes(data)
+
+        assert hash_file(path, "blake3") == blake3(data).hexdigest()
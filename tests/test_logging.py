@@ -0,0 +1,141 @@
+"""
+Structured logging tests: LogContext propagation and formatter output.
+"""
+
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from layoutir.utils import LogContext, LogContextFilter, setup_logging
+from layoutir.utils.logging_config import StructuredFormatter, _stop_listener
+
+
+@pytest.fixture
+def structured_log():
+    """Logger writing StructuredFormatter lines to a buffer, bypassing setup_logging()"""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter())
+    handler.addFilter(LogContextFilter())
+    logger = logging.getLogger("layoutir.tests.logging")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    def lines():
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield logger, lines
+    logger.removeHandler(handler)
+
+
+class TestLogContext:
+    """LogContext fields reach records through LogContextFilter"""
+
+    def test_import_leaves_record_factory_alone(self):
+        """Test: importing layoutir does not patch process-wide logging state"""
+        assert logging.getLogRecordFactory() is logging.LogRecord
+
+    def test_custom_handler_sees_context(self, structured_log):
+        """Test: a handler not installed by setup_logging() gets the fields via the filter"""
+        logger, lines = structured_log
+        with LogContext(logger, document_id="D1"):
+            logger.info("inside")
+        logger.info("outside")
+
+        inside, outside = lines()
+        assert inside["document_id"] == "D1"
+        assert "document_id" not in outside
+
+    def test_nested_contexts_merge_and_restore(self, structured_log):
+        """Test: inner fields add to outer ones and are dropped on exit"""
+        logger, lines = structured_log
+        with LogContext(logger, document_id="D1"):
+            with LogContext(logger, stage="parse"):
+                logger.info("inner")
+            logger.info("outer")
+
+        inner, outer = lines()
+        assert (inner["document_id"], inner["stage"]) == ("D1", "parse")
+        assert outer["document_id"] == "D1"
+        assert "stage" not in outer
+
+    def test_extra_takes_precedence(self, structured_log):
+        """Test: extra= overrides a context field without raising"""
+        logger, lines = structured_log
+        with LogContext(logger, document_id="D1"):
+            logger.info("explicit", extra={"document_id": "D2"})
+
+        assert lines()[0]["document_id"] == "D2"
+
+    def test_threads_are_isolated(self, structured_log):
+        """Test: concurrent contexts never leak into another thread's records"""
+        logger, lines = structured_log
+        barrier = threading.Barrier(2)
+
+        def worker(document_id):
+            with LogContext(logger, document_id=document_id):
+                # Both contexts are active before either thread logs
+                barrier.wait()
+                logger.info(document_id)
+
+        threads = [threading.Thread(target=worker, args=(d,)) for d in ("T1", "T2")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        records = lines()
+        assert len(records) == 2
+        assert all(record["document_id"] == record["message"] for record in records)
+
+
+class TestSetupLogging:
+    """setup_logging() output through the queue listener"""
+
+    @pytest.fixture
+    def restore_root_logger(self):
+        """Drain the listener and restore the root logger after the test"""
+        root_logger = logging.getLogger()
+        handlers, level = root_logger.handlers[:], root_logger.level
+        yield
+        _stop_listener()
+        root_logger.handlers = handlers
+        root_logger.setLevel(level)
+
+    def test_log_file_is_utf8(self, tmp_path, restore_root_logger):
+        """Test: non-ASCII messages are written as UTF-8 regardless of locale"""
+        log_file = tmp_path / "logs" / "run.log"
+        setup_logging(log_file=log_file)
+
+        with LogContext(logging.getLogger("layoutir.tests"), document_id="D1"):
+            logging.getLogger("layoutir.tests").info("Café – 表")
+        _stop_listener()
+
+        (record,) = [
+            json.loads(line) for line in log_file.read_bytes().decode("utf-8").splitlines()
+        ]
+        assert record["message"] == "Café – 表"
+        assert record["document_id"] == "D1"
+
+    def test_console_lines_stay_json_around_prints(self, capsys, restore_root_logger):
+        """Test: console records never interleave with print() on stdout"""
+        setup_logging()
+        logger = logging.getLogger("layoutir.tests")
+        for i in range(3):
+            logger.info("stage %d done", i)
+        print("=== Processing Complete ===")
+        logger.info("after summary")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "=== Processing Complete ===" in lines
+        records = [json.loads(line) for line in lines if line != "=== Processing Complete ==="]
+        assert [r["message"] for r in records] == [
+            "stage 0 done",
+            "stage 1 done",
+            "stage 2 done",
+            "after summary",
+        ]
@@ -1,37 +1,78 @@
 """Round-trip stability tests"""
 
+import array
+import bisect
+import copy
+import functools
+import os
 import pytest
 import re
 from pathlib import Path
 import json
-from layoutir import Pipeline, Document
-from layoutir.adapters import DoclingAdapter
+from layoutir import Document
 from layoutir.utils.equality import assert_semantic_equality, compute_semantic_hash
 
+try:
+    import ahocorasick
+except ImportError:  # optional: stability scans fall back to substring checks
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional: pip install layoutir[fast]
+    orjson = None
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize test data to JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@pytest.fixture(scope="session")
+def _parsed_cache():
+    """Serialized IR per (resolved PDF path, mtime), shared across the session"""
+    return {}
+
+
+@pytest.fixture
+def parse_cached(_parsed_cache):
+    """
+    Parse a PDF at most once per session.
+
+    Returns a function (pipeline, pdf_path, output_dir) -> Document that runs
+    pipeline.process on the first call for a PDF and afterwards returns a
+    fresh Document deserialized from the stored IR. Determinism tests must
+    still compare against at least one fresh pipeline.process() result.
+    """
+
+    def parse(pipeline, pdf_path, output_dir):
+        key = (pdf_path.resolve(), pdf_path.stat().st_mtime_ns)
+        if key not in _parsed_cache:
+            doc = pipeline.process(pdf_path, output_dir)
+            _parsed_cache[key] = doc.model_dump_json().encode()
+        return Document.model_validate_json(_parsed_cache[key])
+
+    return parse
+
+
+def _block_order_signature(doc: Document) -> tuple:
+    """One immutable (block_id, order) signature per document"""
+    return tuple((b.block_id, b.order) for b in doc.blocks)
+
 
 class TestRoundTripStability:
     """Core round-trip stability tests"""
 
-    @pytest.fixture
-    def pipeline(self):
-        """Create pipeline with GPU disabled for consistent testing"""
-        adapter = DoclingAdapter(use_gpu=False)
-        return Pipeline(adapter=adapter)
-
-    @pytest.fixture
-    def sample_pdf(self):
-        """Use existing test PDF"""
-        docs_dir = Path(__file__).parent.parent / "docs" / "pdfs"
-        pdf_path = docs_dir / "table.pdf"  # Adjust to actual test PDF
-        if not pdf_path.exists():
-            pytest.skip("Test PDF not available")
-        return pdf_path
+    # Parse-heavy: keep on one xdist worker with the shared pipeline
+    pytestmark = pytest.mark.xdist_group("docling")
 
-    def test_parse_twice_identical_ir(self, pipeline, tmp_path, sample_pdf):
+    def test_parse_twice_identical_ir(self, pipeline, tmp_path, sample_pdf, parse_cached):
         """Core test: parse(pdf) twice produces identical IR"""
         output_dir1 = tmp_path / "run1"
         output_dir1.mkdir()
-        doc1 = pipeline.process(sample_pdf, output_dir1)
+        doc1 = parse_cached(pipeline, sample_pdf, output_dir1)
 
         output_dir2 = tmp_path / "run2"
         output_dir2.mkdir()
@@ -40,41 +81,59 @@ class TestRoundTripStability:
         # Assert semantic equality
         assert_semantic_equality(doc1, doc2)
 
-    def test_serialize_deserialize_stability(self, pipeline, tmp_path, sample_pdf):
+    def test_serialize_deserialize_stability(self, pipeline, tmp_path, sample_pdf, parse_cached):
         """Test: IR → JSON → IR preserves content"""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
-        doc1 = pipeline.process(sample_pdf, output_dir)
+        doc1 = parse_cached(pipeline, sample_pdf, output_dir)
 
-        # Serialize
+        # Serialize (compact: pydantic's own JSON dump beats dict + orjson here)
         json_path = tmp_path / "ir.json"
-        with open(json_path, "w") as f:
-            f.write(doc1.model_dump_json(indent=2))
+        json_path.write_bytes(doc1.model_dump_json().encode())
 
         # Deserialize
-        with open(json_path, "r") as f:
-            doc2 = Document(**json.load(f))
+        doc2 = Document.model_validate_json(json_path.read_bytes())
 
         assert_semantic_equality(doc1, doc2)
 
-    def test_block_order_deterministic(self, pipeline, tmp_path, sample_pdf):
+    def test_block_order_deterministic(self, pipeline, tmp_path, sample_pdf, parse_cached):
         """Test: Block order is deterministic across runs"""
+        output_dir1 = tmp_path / "run1"
+        output_dir1.mkdir()
+        doc1 = parse_cached(pipeline, sample_pdf, output_dir1)
+
+        # The second run must be a fresh parse, never another cache hit
+        output_dir2 = tmp_path / "run2"
+        output_dir2.mkdir()
+        doc2 = pipeline.process(sample_pdf, output_dir2)
+
+        assert compute_semantic_hash(doc1) == compute_semantic_hash(doc2)
+        assert _block_order_signature(doc1) == _block_order_signature(doc2)
+
+    @pytest.mark.slow
+    def test_block_order_deterministic_three_runs(
+        self, pipeline, tmp_path, sample_pdf, parse_cached
+    ):
+        """Test: Block order is identical across one cached and two fresh runs"""
         docs = []
         for i in range(3):
             output_dir = tmp_path / f"run{i}"
             output_dir.mkdir()
-            doc = pipeline.process(sample_pdf, output_dir)
-            docs.append(doc)
+            # First run may come from the session cache; the others are fresh parses
+            if i == 0:
+                docs.append(parse_cached(pipeline, sample_pdf, output_dir))
+            else:
+                docs.append(pipeline.process(sample_pdf, output_dir))
 
-        block_orders = [[(b.block_id, b.order) for b in doc.blocks] for doc in docs]
+        block_orders = [_block_order_signature(doc) for doc in docs]
 
         assert block_orders[0] == block_orders[1] == block_orders[2]
 
-    def test_spatial_ordering_validation(self, pipeline, tmp_path, sample_pdf):
+    def test_spatial_ordering_validation(self, pipeline, tmp_path, sample_pdf, parse_cached):
         """Test: Ordering validation runs and annotates blocks"""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
-        doc = pipeline.process(sample_pdf, output_dir)
+        doc = parse_cached(pipeline, sample_pdf, output_dir)
 
         blocks_with_ordering = [b for b in doc.blocks if b.ordering_metadata is not None]
         assert len(blocks_with_ordering) > 0
@@ -83,15 +142,15 @@ class TestRoundTripStability:
             meta = block.ordering_metadata
             assert meta.docling_order == block.order
 
-    def test_semantic_hash_stability(self, pipeline, tmp_path, sample_pdf):
+    def test_semantic_hash_stability(self, pipeline, tmp_path, sample_pdf, parse_cached):
         """
         Test: Semantic hash is deterministic across runs.
         This is the LONG-TERM STABILITY PROOF.
         """
-        # Parse twice
+        # Parse twice: one (possibly cached) run, one fresh run
         output_dir1 = tmp_path / "run1"
         output_dir1.mkdir()
-        doc1 = pipeline.process(sample_pdf, output_dir1)
+        doc1 = parse_cached(pipeline, sample_pdf, output_dir1)
         hash1 = compute_semantic_hash(doc1)
 
         output_dir2 = tmp_path / "run2"
@@ -103,6 +162,18 @@ class TestRoundTripStability:
         assert hash1 == hash2, f"Semantic hashes differ: {hash1} != {hash2}"
 
 
+_GOLDEN_DIR = Path(__file__).parent / "fixtures" / "golden_ir"
+_PDF_DIR = Path(__file__).parent.parent / "docs" / "pdfs"
+
+
+def _load_golden_hashes() -> dict:
+    """Golden semantic hashes by PDF name; empty if the fixtures are not created yet"""
+    golden_hashes_path = _GOLDEN_DIR / "golden_hashes.json"
+    if not golden_hashes_path.exists():
+        return {}
+    return json.loads(golden_hashes_path.read_bytes())
+
+
 class TestGoldenIRFixtures:
     """
     REGRESSION TEST REQUIREMENT: Golden IR fixtures for determinism.
@@ -110,18 +181,27 @@ class TestGoldenIRFixtures:
     This test suite ensures that future changes don't break determinism.
     """
 
+    # Parse-heavy: keep on one xdist worker with the shared pipeline
+    pytestmark = pytest.mark.xdist_group("docling")
+
     @pytest.fixture
     def golden_fixtures_dir(self):
         """Directory containing golden IR JSON files"""
-        return Path(__file__).parent / "fixtures" / "golden_ir"
-
-    @pytest.fixture
-    def pipeline(self):
-        """Create pipeline with GPU disabled for consistent testing"""
-        adapter = DoclingAdapter(use_gpu=False)
-        return Pipeline(adapter=adapter)
-
-    def test_golden_ir_hash_regression(self, pipeline, tmp_path, golden_fixtures_dir):
+        return _GOLDEN_DIR
+
+    @pytest.fixture(scope="class", autouse=True)
+    def _prewarm_golden_pdfs(self, prewarm_page_cache):
+        """Start read-ahead for every golden PDF before the first one is parsed"""
+        for pdf_name in _load_golden_hashes():
+            pdf_path = _PDF_DIR / f"{pdf_name}.pdf"
+            if pdf_path.exists():
+                prewarm_page_cache(pdf_path)
+
+    @pytest.mark.parametrize(
+        "pdf_name,expected_hash",
+        [pytest.param(name, h, id=name) for name, h in sorted(_load_golden_hashes().items())],
+    )
+    def test_golden_ir_hash_regression(self, pipeline, tmp_path, pdf_name, expected_hash):
         """
         CRITICAL REGRESSION TEST: Parse known PDFs and verify hashes match golden values.
 
@@ -131,37 +211,24 @@ class TestGoldenIRFixtures:
         - Float precision drift
         - JSON serialization changes
         """
-        if not golden_fixtures_dir.exists():
-            pytest.skip("Golden fixtures not yet created")
-
-        # Load golden hashes
-        golden_hashes_path = golden_fixtures_dir / "golden_hashes.json"
-        if not golden_hashes_path.exists():
-            pytest.skip("Golden hashes file not found")
-
-        with open(golden_hashes_path, "r") as f:
-            golden_hashes = json.load(f)
-
-        # Test each golden PDF — PDFs live in docs/pdfs/, not in the fixture dir
-        docs_dir = Path(__file__).parent.parent / "docs" / "pdfs"
-        for pdf_name, expected_hash in golden_hashes.items():
-            pdf_path = docs_dir / f"{pdf_name}.pdf"
-            if not pdf_path.exists():
-                continue
-
-            # Parse and compute hash
-            output_dir = tmp_path / pdf_name
-            output_dir.mkdir()
-            doc = pipeline.process(pdf_path, output_dir)
-            actual_hash = compute_semantic_hash(doc)
+        # PDFs live in docs/pdfs/, not in the fixture dir
+        pdf_path = _PDF_DIR / f"{pdf_name}.pdf"
+        if not pdf_path.exists():
+            pytest.skip(f"Golden PDF not available: {pdf_path.name}")
 
-            # CRITICAL: Hash must match golden value
-            assert actual_hash == expected_hash, (
-                f"Hash regression for {pdf_name}:\n"
-                f"  Expected: {expected_hash}\n"
-                f"  Actual:   {actual_hash}\n"
-                f"  This indicates determinism has regressed!"
-            )
+        # Parse and compute hash
+        output_dir = tmp_path / pdf_name
+        output_dir.mkdir()
+        doc = pipeline.process(pdf_path, output_dir)
+        actual_hash = compute_semantic_hash(doc)
+
+        # CRITICAL: Hash must match golden value
+        assert actual_hash == expected_hash, (
+            f"Hash regression for {pdf_name}:\n"
+            f"  Expected: {expected_hash}\n"
+            f"  Actual:   {actual_hash}\n"
+            f"  This indicates determinism has regressed!"
+        )
 
     @pytest.mark.skip(reason="Manual test for creating golden fixtures")
     def test_create_golden_fixtures(self, pipeline, tmp_path, golden_fixtures_dir):
@@ -207,43 +274,44 @@ class TestGoldenIRFixtures:
         print(f"Golden fixtures created in {golden_fixtures_dir}")
 
 
+# Minimal pre-1.0.4 IR document (no formatting_data / ordering_metadata);
+# tests deep-copy it before adding fields
+_BASE_IR = {
+    "document_id": "doc_test",
+    "schema_version": "1.0.0",
+    "parser_version": "docling-1.0.0",
+    "metadata": {
+        "page_count": 1,
+        "source_format": "pdf",
+        "source_path": "/test.pdf",
+        "source_hash": "abc123",
+    },
+    "blocks": [
+        {
+            "block_id": "blk_test",
+            "type": "paragraph",
+            "page_number": 1,
+            "content": "Test",
+            "order": 0,
+            "metadata": {},
+        }
+    ],
+    "relationships": [],
+    "stats": {"block_count": 1},
+    "processing_timestamp": "2024-01-01T00:00:00",
+    "config_used": {},
+}
+
+
 class TestBackwardCompatibility:
     """Test backward compatibility with existing IR"""
 
     def test_load_ir_without_formatting(self, tmp_path):
         """Test: Can load old IR JSON without new fields"""
-        ir_data = {
-            "document_id": "doc_test",
-            "schema_version": "1.0.0",
-            "parser_version": "docling-1.0.0",
-            "metadata": {
-                "page_count": 1,
-                "source_format": "pdf",
-                "source_path": "/test.pdf",
-                "source_hash": "abc123",
-            },
-            "blocks": [
-                {
-                    "block_id": "blk_test",
-                    "type": "paragraph",
-                    "page_number": 1,
-                    "content": "Test",
-                    "order": 0,
-                    "metadata": {},
-                }
-            ],
-            "relationships": [],
-            "stats": {"block_count": 1},
-            "processing_timestamp": "2024-01-01T00:00:00",
-            "config_used": {},
-        }
-
         ir_path = tmp_path / "old_ir.json"
-        with open(ir_path, "w") as f:
-            json.dump(ir_data, f)
+        ir_path.write_bytes(_json_dumps_bytes(_BASE_IR))
 
-        with open(ir_path, "r") as f:
-            doc = Document(**json.load(f))
+        doc = Document.model_validate_json(ir_path.read_bytes())
 
         assert doc.document_id == "doc_test"
         assert doc.blocks[0].formatting_data is None  # New field defaults to None
@@ -251,48 +319,26 @@ class TestBackwardCompatibility:
 
     def test_load_ir_with_optional_fields(self, tmp_path):
         """Test: Can load new IR JSON with optional fields"""
-        ir_data = {
-            "document_id": "doc_test",
-            "schema_version": "1.0.0",
-            "parser_version": "docling-1.0.0",
-            "metadata": {
-                "page_count": 1,
-                "source_format": "pdf",
-                "source_path": "/test.pdf",
-                "source_hash": "abc123",
-            },
-            "blocks": [
-                {
-                    "block_id": "blk_test",
-                    "type": "paragraph",
-                    "page_number": 1,
-                    "content": "Test",
-                    "order": 0,
-                    "metadata": {},
-                    "formatting_data": {
-                        "font": {"name": "Arial", "size": 12.0},
-                        "style": {"bold": True},
-                        "links": [],
-                    },
-                    "ordering_metadata": {
-                        "docling_order": 0,
-                        "spatial_order": 0,
-                        "order_discrepancy": False,
-                    },
-                }
-            ],
-            "relationships": [],
-            "stats": {"block_count": 1},
-            "processing_timestamp": "2024-01-01T00:00:00",
-            "config_used": {},
-        }
+        ir_data = copy.deepcopy(_BASE_IR)
+        ir_data["blocks"][0].update(
+            {
+                "formatting_data": {
+                    "font": {"name": "Arial", "size": 12.0},
+                    "style": {"bold": True},
+                    "links": [],
+                },
+                "ordering_metadata": {
+                    "docling_order": 0,
+                    "spatial_order": 0,
+                    "order_discrepancy": False,
+                },
+            }
+        )
 
         ir_path = tmp_path / "new_ir.json"
-        with open(ir_path, "w") as f:
-            json.dump(ir_data, f)
+        ir_path.write_bytes(_json_dumps_bytes(ir_data))
 
-        with open(ir_path, "r") as f:
-            doc = Document(**json.load(f))
+        doc = Document.model_validate_json(ir_path.read_bytes())
 
         assert doc.document_id == "doc_test"
         assert doc.blocks[0].formatting_data is not None
@@ -301,6 +347,141 @@ class TestBackwardCompatibility:
         assert doc.blocks[0].ordering_metadata.docling_order == 0
 
 
+# Stability-protection scan patterns, compiled once for the module
+_SLICE_RE = re.compile(r"\[:(\d+)\]")
+_JSON_KW_RE = re.compile(
+    r"sort_keys\s*=\s*(?:True|False)"
+    r"|ensure_ascii\s*=\s*(?:True|False)"
+    r"|separators\s*=\s*[\(\[]"
+)
+_SHA256_RE = re.compile(r'["\']sha256["\']')
+_UTF8_RE = re.compile(r'["\']utf-8["\']')
+
+# Name prefixes of _stability_constants values; a line using one is compliant
+_CONSTANT_PREFIXES = (
+    "BLOCK_ID_",
+    "TABLE_ID_",
+    "HASH_STRING_",
+    "HASH_DICT_",
+    "SPATIAL_",
+    "CANONICAL_JSON_",
+    "SEMANTIC_HASH_",
+)
+_CONSTANT_RE = re.compile("|".join(map(re.escape, _CONSTANT_PREFIXES)))
+
+_RULE_PATTERNS = {
+    "slice": _SLICE_RE,
+    "json_kw": _JSON_KW_RE,
+    "sha256": _SHA256_RE,
+    "utf8": _UTF8_RE,
+}
+
+# Fixed substrings that every match of a rule's pattern contains; files
+# without any of them cannot violate the rule and skip its regex pass
+_RULE_ANCHORS = {
+    "slice": ("[:",),
+    "json_kw": ("sort_keys", "ensure_ascii", "separators"),
+    "sha256": ("sha256",),
+    "utf8": ("utf-8",),
+}
+
+
+def _build_anchor_automaton():
+    """One Aho-Corasick automaton over all rule anchors, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rule, anchors in _RULE_ANCHORS.items():
+        for anchor in anchors:
+            automaton.add_word(anchor, rule)
+    automaton.make_automaton()
+    return automaton
+
+
+_ANCHOR_AUTOMATON = _build_anchor_automaton()
+
+
+def _rules_present(text: str) -> frozenset:
+    """Rules whose anchors occur in text, found in a single pass when possible"""
+    if _ANCHOR_AUTOMATON is not None:
+        return frozenset(rule for _, rule in _ANCHOR_AUTOMATON.iter(text))
+    return frozenset(
+        rule for rule, anchors in _RULE_ANCHORS.items() if any(anchor in text for anchor in anchors)
+    )
+
+
+_SRC_DIR = Path(__file__).parent.parent / "src" / "layoutir"
+_CONSTANTS_FILE = _SRC_DIR / "_stability_constants.py"
+
+
+# Line prefixes (after indentation) treated as comments or docstring text
+_COMMENT_STARTS = ("#", '"""', "'''", "- ", "* ")
+
+
+def _is_comment_or_docstring(line: str) -> bool:
+    return line.lstrip().startswith(_COMMENT_STARTS)
+
+
+def _iter_py_files(directory: str):
+    """Yield DirEntry objects for .py files under directory, in sorted order"""
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_py_files(entry.path)
+        elif entry.name.endswith(".py"):
+            yield entry
+
+
+def _line_starts(text: str) -> array.array:
+    """Offset of the first character of every line in text"""
+    starts = array.array("q", [0])
+    pos = text.find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    return starts
+
+
+@functools.lru_cache(maxsize=None)
+def _read_source(path: str, mtime_ns: int):
+    """(text, line_starts, rules) for one file; the mtime key drops stale entries"""
+    # Python sources are UTF-8 (PEP 3120); skip the locale lookup and TextIOWrapper
+    text = Path(path).read_bytes().decode("utf-8")
+    return text, _line_starts(text), _rules_present(text)
+
+
+@pytest.fixture(scope="session")
+def source_files():
+    """(relative_path, text, line_starts, rules) for every .py source file, read once"""
+    files = []
+    for entry in _iter_py_files(str(_SRC_DIR)):
+        if entry.path == str(_CONSTANTS_FILE):
+            continue
+        rel = os.path.relpath(entry.path, _SRC_DIR)
+        files.append((rel, *_read_source(entry.path, entry.stat().st_mtime_ns)))
+    return files
+
+
+def _scan(source_files):
+    """
+    Yield (rel, lineno, line, rule, match) for every rule match on live code lines.
+
+    Each file is visited once; only the rules its anchor pass found are run,
+    each as one finditer() over the whole text. Line numbers come from a
+    bisect over the line-start offsets, and the line itself is only sliced
+    out (and checked for being a comment) for the (rare) matches.
+    """
+    for rel, text, starts, rules in source_files:
+        for rule in rules:
+            for m in _RULE_PATTERNS[rule].finditer(text):
+                index = bisect.bisect_right(starts, m.start()) - 1
+                end = starts[index + 1] - 1 if index + 1 < len(starts) else len(text)
+                line = text[starts[index] : end]
+                if not _is_comment_or_docstring(line):
+                    yield rel, index + 1, line, rule, m
+
+
 class TestStabilityProtection:
     """
     STABILITY INVARIANT ENFORCEMENT:
@@ -324,8 +505,8 @@ class TestStabilityProtection:
       - Variable references that contain a constant name on the right-hand side
     """
 
-    SRC_DIR = Path(__file__).parent.parent / "src" / "layoutir"
-    CONSTANTS_FILE = SRC_DIR / "_stability_constants.py"
+    SRC_DIR = _SRC_DIR
+    CONSTANTS_FILE = _CONSTANTS_FILE
 
     # Files whose encoding='utf-8' is file I/O, not hash-path
     FILE_IO_ENCODING_EXCLUSIONS = {
@@ -333,42 +514,38 @@ class TestStabilityProtection:
         "exporters/text_exporter.py",
         "exporters/asset_writer.py",
         "pipeline.py",
+        "utils/logging_config.py",
     }
 
-    def _source_lines(self, skip_files=None):
-        """Yield (relative_path, lineno, line) for all .py source lines."""
-        skip_files = skip_files or set()
-        for py_file in self.SRC_DIR.rglob("*.py"):
-            rel = py_file.relative_to(self.SRC_DIR)
-            if str(rel) in skip_files or py_file == self.CONSTANTS_FILE:
-                continue
-            for lineno, line in enumerate(py_file.read_text().splitlines(), 1):
-                yield str(rel), lineno, line
-
-    def _is_comment_or_docstring(self, line: str) -> bool:
-        stripped = line.strip()
-        return (
-            stripped.startswith("#")
-            or stripped.startswith('"""')
-            or stripped.startswith("'''")
-            or stripped.startswith("- ")
-            or stripped.startswith("* ")
-        )
-
     def _uses_constant(self, line: str) -> bool:
         """True if line references a _stability_constants name on the RHS."""
-        constant_prefixes = (
-            "BLOCK_ID_",
-            "TABLE_ID_",
-            "HASH_STRING_",
-            "HASH_DICT_",
-            "SPATIAL_",
-            "CANONICAL_JSON_",
-            "SEMANTIC_HASH_",
-        )
-        return any(prefix in line for prefix in constant_prefixes)
-
-    def test_no_bare_hex_length_slices(self):
+        return _CONSTANT_RE.search(line) is not None
+
+    # Slice lengths frozen in _stability_constants.py; display-only slices are exempt
+    CRITICAL_SLICE_LENGTHS = {16, 500, 200}
+
+    def _is_violation(self, rel: str, line: str, rule: str, m: re.Match) -> bool:
+        """Apply a rule's false-positive exclusions to one match"""
+        if rule == "slice" and int(m.group(1)) not in self.CRITICAL_SLICE_LENGTHS:
+            return False
+        # Allow docstring default descriptions like (default: sha256)
+        if rule == "sha256" and ("default:" in line or "default =" in line):
+            return False
+        # open(..., encoding='utf-8') is file I/O — not hash-path
+        if rule == "utf8" and (rel in self.FILE_IO_ENCODING_EXCLUSIONS or "open(" in line):
+            return False
+        return not self._uses_constant(line)
+
+    @pytest.fixture(scope="class")
+    def violations(self, source_files):
+        """Violations per rule, collected in a single pass over the sources"""
+        found = {rule: [] for rule in _RULE_PATTERNS}
+        for rel, lineno, line, rule, m in _scan(source_files):
+            if self._is_violation(rel, line, rule, m):
+                found[rule].append(f"{rel}:{lineno}: {line.strip()}")
+        return found
+
+    def test_no_bare_hex_length_slices(self, violations):
         """No hardcoded stability-critical slice lengths outside _stability_constants.py.
 
         Checks specifically for the magic numbers that correspond to frozen constants:
@@ -378,73 +555,32 @@ class TestStabilityProtection:
 
         Display-only slices ([:30], [:3], etc.) are NOT stability-critical and are exempt.
         """
-        # Only the specific lengths that are frozen in _stability_constants.py
-        critical_lengths = {16, 500, 200}
-        violations = []
-        for rel, lineno, line in self._source_lines():
-            if self._is_comment_or_docstring(line):
-                continue
-            for m in re.finditer(r"\[:(\d+)\]", line):
-                n = int(m.group(1))
-                if n in critical_lengths and not self._uses_constant(line):
-                    violations.append(f"{rel}:{lineno}: {line.strip()}")
-        assert not violations, (
+        assert not violations["slice"], (
             "Bare [:N] slice with stability-critical length found — use the corresponding constant:\n"
             "  [:16]  → BLOCK_ID_HEX_LENGTH\n"
             "  [:500] → BLOCK_ID_CONTENT_TRUNCATION\n"
-            "  [:200] → TABLE_ID_TEXT_TRUNCATION\n" + "\n".join(violations)
+            "  [:200] → TABLE_ID_TEXT_TRUNCATION\n" + "\n".join(violations["slice"])
         )
 
-    def test_no_inline_json_dumps_kwargs(self):
+    def test_no_inline_json_dumps_kwargs(self, violations):
         """No inline sort_keys=True/False or ensure_ascii= in live code outside constants"""
-        violations = []
-        for rel, lineno, line in self._source_lines():
-            if self._is_comment_or_docstring(line):
-                continue
-            # Detect inline literal kwargs: sort_keys=True, ensure_ascii=False, etc.
-            if re.search(r"sort_keys\s*=\s*(True|False)", line) and not self._uses_constant(line):
-                violations.append(f"{rel}:{lineno}: {line.strip()}")
-            if re.search(r"ensure_ascii\s*=\s*(True|False)", line) and not self._uses_constant(
-                line
-            ):
-                violations.append(f"{rel}:{lineno}: {line.strip()}")
-            if re.search(r"separators\s*=\s*[\(\[]", line) and not self._uses_constant(line):
-                violations.append(f"{rel}:{lineno}: {line.strip()}")
-        assert not violations, (
+        assert not violations["json_kw"], (
             "Inline json.dumps kwargs found — use CANONICAL_JSON_* or HASH_DICT_* constants:\n"
-            + "\n".join(violations)
+            + "\n".join(violations["json_kw"])
         )
 
-    def test_no_hardcoded_hash_algorithm(self):
+    def test_no_hardcoded_hash_algorithm(self, violations):
         """No 'sha256' string literals in live code outside constants"""
-        violations = []
-        for rel, lineno, line in self._source_lines():
-            if self._is_comment_or_docstring(line):
-                continue
-            # Allow docstring default descriptions like (default: sha256)
-            if "default:" in line or "default =" in line:
-                continue
-            if re.search(r'["\']sha256["\']', line) and not self._uses_constant(line):
-                violations.append(f"{rel}:{lineno}: {line.strip()}")
-        assert not violations, (
+        assert not violations["sha256"], (
             "Hardcoded 'sha256' found — use BLOCK_ID_HASH_ALGORITHM or SEMANTIC_HASH_ALGORITHM:\n"
-            + "\n".join(violations)
+            + "\n".join(violations["sha256"])
         )
 
-    def test_no_hardcoded_encoding_on_hash_path(self):
+    def test_no_hardcoded_encoding_on_hash_path(self, violations):
         """No hardcoded 'utf-8' on hash-path files (file I/O exclusions are exempt)"""
-        violations = []
-        for rel, lineno, line in self._source_lines(skip_files=self.FILE_IO_ENCODING_EXCLUSIONS):
-            if self._is_comment_or_docstring(line):
-                continue
-            # open(..., encoding='utf-8') is file I/O — not hash-path
-            if "open(" in line:
-                continue
-            if re.search(r'["\']utf-8["\']', line) and not self._uses_constant(line):
-                violations.append(f"{rel}:{lineno}: {line.strip()}")
-        assert not violations, (
+        assert not violations["utf8"], (
             "Hardcoded 'utf-8' on hash path — use HASH_STRING_ENCODING or SEMANTIC_HASH_ENCODING:\n"
-            + "\n".join(violations)
+            + "\n".join(violations["utf8"])
         )
 
     def test_stability_constants_exports_all_critical_names(self):
@@ -459,11 +595,15 @@ class TestStabilityProtection:
             CANONICAL_JSON_SEPARATORS,
             CANONICAL_JSON_SORT_KEYS,
             HASH_DICT_ENSURE_ASCII,
+            HASH_DICT_SERIALIZER,
             HASH_DICT_SORT_KEYS,
             HASH_STRING_ENCODING,
+            IMAGE_ID_BLAKE2B_PERSON,
+            IMAGE_ID_SCHEME,
             SCHEMA_VERSION,
             SEMANTIC_HASH_ALGORITHM,
             SEMANTIC_HASH_ENCODING,
+            SHA256_TREE_LEAF_SIZE,
             SPATIAL_ROUND_PRECISION,
             TABLE_ID_TEXT_TRUNCATION,
         )
@@ -474,8 +614,12 @@ class TestStabilityProtection:
         assert BLOCK_ID_CONTENT_TRUNCATION == 500
         assert TABLE_ID_TEXT_TRUNCATION == 200
         assert HASH_STRING_ENCODING == "utf-8"
+        assert IMAGE_ID_SCHEME == "composite"
+        assert IMAGE_ID_BLAKE2B_PERSON == b"layoutir-img"
         assert HASH_DICT_SORT_KEYS is True
         assert HASH_DICT_ENSURE_ASCII is True
+        assert HASH_DICT_SERIALIZER == "json"
+        assert SHA256_TREE_LEAF_SIZE == 4 * 1024 * 1024
         assert SPATIAL_ROUND_PRECISION == 4
         assert isinstance(BLOCK_TYPE_SORT_PRIORITY, dict)
         assert CANONICAL_JSON_SORT_KEYS is True